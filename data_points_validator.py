@@ -6,10 +6,20 @@ Automatic validation of data points and conversion to prediction format
 
 import json
 import logging
+import os
 import subprocess
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+# orjson is an optional faster JSON backend, stdlib json is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Logging configuration for process tracking
 logging.basicConfig(
@@ -19,12 +29,68 @@ logging.basicConfig(
 log_instance = logging.getLogger(__name__)
 
 
+def json_loads(raw_data: Union[str, bytes]) -> Any:
+    """Decodes JSON using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw_data)
+    return json.loads(raw_data)
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Encodes data to compact UTF-8 JSON using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def list_json_files(source_folder: Path) -> List[Path]:
+    """Lists JSON files in a folder using a single directory scan"""
+    try:
+        with os.scandir(source_folder) as folder_entries:
+            return [
+                Path(source_folder, folder_entry.name)
+                for folder_entry in folder_entries
+                if folder_entry.name.endswith('.json') and folder_entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 class DataSetLoader:
     """Dataset loader from JSON format"""
     
-    def __init__(self):
-        """Initialize the loader"""
+    __slots__ = ("processed_count", "cache_file", "rejected_files", "cache_modified")
+    
+    # Fields every data point must contain
+    MANDATORY_FIELDS = frozenset({
+        "instance_id",
+        "repo",
+        "base_commit",
+        "patch",
+        "FAIL_TO_PASS",
+        "PASS_TO_PASS",
+    })
+    
+    # Test list fields and the keys their pre-built lookup sets are stored under
+    TEST_SET_FIELDS = {
+        "FAIL_TO_PASS": "_fail_to_pass_set",
+        "PASS_TO_PASS": "_pass_to_pass_set",
+    }
+    
+    # Bump whenever integrity rules change so stale rejections are discarded
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize the loader
+        
+        Args:
+            cache_file: Optional file persisting rejected data files between runs
+        """
         self.processed_count = 0
+        self.cache_file = cache_file
+        self.cache_modified = False
+        self.rejected_files = self._read_rejection_cache()
     
     def load_datasets(self, source_folder: Path, file_list: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -37,51 +103,99 @@ class DataSetLoader:
         Returns:
             List of dictionaries with data
         """
-        log_instance.info(f"Starting load from folder: {source_folder}")
+        return list(self.load_datasets_by_file(source_folder, file_list).values())
+    
+    def load_datasets_by_file(self, source_folder: Path, file_list: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads datasets from specified folder keyed by source file name
+        
+        Args:
+            source_folder: Folder with JSON data files
+            file_list: Optional list of file names to load
+            
+        Returns:
+            Dictionary mapping requested file name (without .json extension) to its data
+        """
+        log_instance.info("Starting load from folder: %s", source_folder)
         
         if not source_folder.exists():
-            log_instance.error(f"Source folder not found: {source_folder}")
-            return []
+            log_instance.error("Source folder not found: %s", source_folder)
+            return {}
         
-        dataset_collection = []
+        dataset_collection = {}
         
         if file_list is None:
             # Load all JSON files
-            json_file_paths = list(source_folder.glob("*.json"))
+            json_file_paths = {json_path.stem: json_path for json_path in list_json_files(source_folder)}
         else:
-            # Load only specified files
-            json_file_paths = []
+            # Load only specified files keyed by the requested name, which may
+            # include subfolders; missing ones are reported while parsing
+            json_file_paths = {}
             for filename in file_list:
-                if not filename.endswith('.json'):
-                    filename = filename + '.json'
-                
-                full_path = source_folder / filename
-                if full_path.exists():
-                    json_file_paths.append(full_path)
-                else:
-                    log_instance.warning(f"File not found: {filename}")
+                if filename.endswith('.json'):
+                    filename = filename[:-len('.json')]
+                json_file_paths[filename] = source_folder / (filename + '.json')
         
-        log_instance.info(f"Found {len(json_file_paths)} JSON files for processing")
+        log_instance.info("Requested %d JSON files for processing", len(json_file_paths))
         
         if not json_file_paths:
             log_instance.warning("No JSON files found for loading")
-            return []
+            return {}
         
-        for json_path in json_file_paths:
-            log_instance.info(f"Processing file: {json_path.name}")
+        for requested_name, json_path in json_file_paths.items():
+            log_instance.debug("Processing file: %s", json_path.name)
             dataset_item = self._parse_json_file(json_path)
             
             if dataset_item:
-                item_id = dataset_item.get("instance_id", "unknown")
-                log_instance.info(f"Loaded item: {item_id}")
-                dataset_collection.append(dataset_item)
+                dataset_collection[requested_name] = dataset_item
                 self.processed_count += 1
             else:
-                log_instance.warning(f"Failed to load: {json_path.name}")
+                log_instance.warning("Failed to load: %s", json_path.name)
         
-        log_instance.info(f"Total loaded items: {len(dataset_collection)}")
+        log_instance.info("Total loaded items: %d", len(dataset_collection))
+        self._write_rejection_cache()
         return dataset_collection
     
+    def _read_rejection_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Reads file signatures and rejection reasons of previously rejected data files"""
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        
+        try:
+            cached_content = json_loads(self.cache_file.read_bytes())
+        except Exception as cache_error:
+            log_instance.warning("Ignoring unreadable cache %s: %s", self.cache_file, cache_error)
+            return {}
+        
+        if cached_content.get("version") != self.CACHE_VERSION:
+            log_instance.info("Discarding outdated cache: %s", self.cache_file)
+            self.cache_modified = True
+            return {}
+        
+        # Forget files that no longer exist
+        rejected_files = {
+            cache_key: cached_rejection
+            for cache_key, cached_rejection in cached_content.get("rejected_files", {}).items()
+            if os.path.exists(cache_key)
+        }
+        if len(rejected_files) != len(cached_content.get("rejected_files", {})):
+            self.cache_modified = True
+        return rejected_files
+    
+    def _write_rejection_cache(self) -> None:
+        """Persists file signatures and rejection reasons of rejected data files"""
+        if self.cache_file is None or not self.cache_modified:
+            return
+        
+        try:
+            self.cache_file.write_bytes(json_dumps_bytes({
+                "version": self.CACHE_VERSION,
+                "rejected_files": self.rejected_files,
+            }))
+            self.cache_modified = False
+        except Exception as cache_error:
+            log_instance.warning("Failed to write cache %s: %s", self.cache_file, cache_error)
+    
     def _parse_json_file(self, json_path: Path) -> Optional[Dict[str, Any]]:
         """
         Parses a single JSON file
@@ -92,72 +206,103 @@ class DataSetLoader:
         Returns:
             Dictionary with data or None on error
         """
+        cache_key = str(json_path.absolute())
+        
         try:
-            with open(json_path, 'r', encoding='utf-8') as file_handle:
-                dataset_content = json.load(file_handle)
+            # Unchanged files that were rejected before are skipped without parsing
+            file_stat = json_path.stat()
+            file_signature = [file_stat.st_mtime_ns, file_stat.st_size]
+            cached_rejection = self.rejected_files.get(cache_key)
+            if cached_rejection is not None and cached_rejection["signature"] == file_signature:
+                log_instance.warning("Skipping unchanged file that failed validation before: %s - %s",
+                                     json_path.name, cached_rejection["reason"])
+                return None
+            
+            # Decode from raw bytes to skip the text-mode codec layer
+            dataset_content = json_loads(json_path.read_bytes())
             
-            if self._check_data_integrity(dataset_content):
+            self._decode_test_lists(dataset_content)
+            
+            integrity_problem = self._find_integrity_problem(dataset_content)
+            if integrity_problem is None:
+                if self.rejected_files.pop(cache_key, None) is not None:
+                    self.cache_modified = True
                 return dataset_content
             else:
-                log_instance.warning(f"Data integrity check failed: {json_path.name}")
+                log_instance.warning("Data integrity check failed: %s - %s", json_path.name, integrity_problem)
+                self._remember_rejection(cache_key, file_signature, integrity_problem)
                 return None
                 
+        except FileNotFoundError:
+            log_instance.warning("File not found: %s", json_path.name)
+            return None
         except json.JSONDecodeError as json_err:
-            log_instance.error(f"JSON parsing error in {json_path.name}: {json_err}")
+            log_instance.error("JSON parsing error in %s: %s", json_path.name, json_err)
+            self._remember_rejection(cache_key, file_signature, f"JSON parsing error: {json_err}")
             return None
         except Exception as general_err:
-            log_instance.error(f"General error loading {json_path.name}: {general_err}")
+            log_instance.error("General error loading %s: %s", json_path.name, general_err)
             return None
     
-    def _check_data_integrity(self, dataset_item: Dict[str, Any]) -> bool:
+    def _remember_rejection(self, cache_key: str, file_signature: List[int], rejection_reason: str) -> None:
+        """Records a rejected file and why, so it is skipped while it stays unchanged"""
+        self.rejected_files[cache_key] = {"signature": file_signature, "reason": rejection_reason}
+        self.cache_modified = True
+    
+    def _decode_test_lists(self, dataset_item: Dict[str, Any]) -> None:
+        """
+        Decodes JSON-encoded test lists once and caches them as sets
+        
+        Args:
+            dataset_item: Data item updated in place
+        """
+        for field_name, set_key in self.TEST_SET_FIELDS.items():
+            if field_name not in dataset_item:
+                continue
+            
+            test_list = dataset_item[field_name]
+            if isinstance(test_list, str):
+                test_list = json_loads(test_list) if test_list.strip() else []
+                dataset_item[field_name] = test_list
+            
+            dataset_item[set_key] = frozenset(test_list)
+    
+    def _find_integrity_problem(self, dataset_item: Dict[str, Any]) -> Optional[str]:
         """
-        Checks data structure integrity
+        Finds the first data structure integrity problem
         
         Args:
             dataset_item: Data item to check
             
         Returns:
-            True if structure is correct, False otherwise
+            Description of the problem or None if structure is correct
         """
-        mandatory_fields = [
-            "instance_id",
-            "repo", 
-            "base_commit",
-            "patch",
-            "FAIL_TO_PASS",
-            "PASS_TO_PASS"
-        ]
-        
-        for field_name in mandatory_fields:
-            if field_name not in dataset_item:
-                log_instance.warning(f"Missing required field '{field_name}'")
-                return False
+        missing_fields = self.MANDATORY_FIELDS.difference(dataset_item.keys())
+        if missing_fields:
+            return f"Missing required fields: {', '.join(sorted(missing_fields))}"
         
-        patch_content = dataset_item.get("patch", "")
-        if not patch_content.strip():
-            log_instance.warning("Patch field is empty")
-            return False
+        # Presence is guaranteed above, so fields are read by subscript
+        if not dataset_item["patch"].strip():
+            return "Patch field is empty"
         
-        failing_tests = dataset_item.get("FAIL_TO_PASS", [])
-        passing_tests = dataset_item.get("PASS_TO_PASS", [])
+        if not (dataset_item["FAIL_TO_PASS"] or dataset_item["PASS_TO_PASS"]):
+            return "Missing test cases FAIL_TO_PASS and PASS_TO_PASS"
         
-        if not failing_tests and not passing_tests:
-            log_instance.warning("Missing test cases FAIL_TO_PASS and PASS_TO_PASS")
-            return False
-        
-        return True
+        return None
 
 
 class PredictionFormatter:
     """Formatter for converting to SWE-bench prediction format"""
     
+    __slots__ = ("ai_model_name", "conversion_stats")
+    
     def __init__(self, ai_model: str = "gpt-4"):
         self.ai_model_name = ai_model
         self.conversion_stats = {"success": 0, "failed": 0}
     
     def transform_to_predictions(self, dataset_items: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Converts data items to prediction format"""
-        log_instance.info(f"Starting conversion of {len(dataset_items)} items to prediction format")
+        log_instance.info("Starting conversion of %d items to prediction format", len(dataset_items))
         
         prediction_list = []
         
@@ -169,9 +314,10 @@ class PredictionFormatter:
                 self.conversion_stats["success"] += 1
             else:
                 self.conversion_stats["failed"] += 1
-                log_instance.warning(f"Failed to convert item: {dataset_item.get('instance_id', 'unknown')}")
+                log_instance.warning("Failed to convert item: %s", dataset_item.get("instance_id", "unknown"))
         
-        log_instance.info(f"Conversion completed: {self.conversion_stats['success']} successful, {self.conversion_stats['failed']} failed")
+        log_instance.info("Conversion completed: %d successful, %d failed",
+                         self.conversion_stats["success"], self.conversion_stats["failed"])
         return prediction_list
     
     def _transform_single_item(self, dataset_item: Dict[str, Any]) -> Optional[Dict[str, str]]:
@@ -180,7 +326,8 @@ class PredictionFormatter:
         patch_data = dataset_item.get("patch")
         
         if not item_id or not patch_data:
-            log_instance.warning(f"Missing required fields: instance_id={item_id}, patch={'present' if patch_data else 'missing'}")
+            log_instance.warning("Missing required fields: instance_id=%s, patch=%s",
+                                 item_id, "present" if patch_data else "missing")
             return None
         
         formatted_prediction = {
@@ -193,40 +340,64 @@ class PredictionFormatter:
     
     def write_predictions_file(self, prediction_data: List[Dict[str, str]], output_path: str) -> bool:
         """Writes predictions to file"""
-        log_instance.info(f"Saving {len(prediction_data)} predictions to file: {output_path}")
+        log_instance.info("Saving %d predictions to file: %s", len(prediction_data), output_path)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as output_file:
-                for prediction_entry in prediction_data:
-                    output_file.write(json.dumps(prediction_entry) + '\n')
+            # Build the whole JSONL payload up front and write it in one call
+            predictions_payload = b'\n'.join(
+                json_dumps_bytes(prediction_entry) for prediction_entry in prediction_data
+            )
+            if predictions_payload:
+                predictions_payload += b'\n'
+            with open(output_path, 'wb') as output_file:
+                output_file.write(predictions_payload)
             
-            log_instance.info(f"Predictions successfully saved: {output_path}")
+            log_instance.info("Predictions successfully saved: %s", output_path)
             return True
             
         except Exception as write_error:
-            log_instance.error(f"File write error {output_path}: {write_error}")
+            log_instance.error("File write error %s: %s", output_path, write_error)
             return False
 
 
 class DataPointProcessor:
     """Main processor for data point validation"""
     
-    def __init__(self, data_folder: str = "data_points"):
+    __slots__ = ("source_directory", "dataset_loader", "prediction_formatter", "validation_metrics")
+    
+    def __init__(self, data_folder: str = "data_points", use_cache: bool = True):
         self.source_directory = Path(data_folder)
-        self.dataset_loader = DataSetLoader()
+        self.dataset_loader = DataSetLoader(cache_file=Path(".validator_cache.json") if use_cache else None)
         self.prediction_formatter = PredictionFormatter(ai_model="gpt-4")
         self.validation_metrics = {}
     
-    def process_validation(self, target_files: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Runs validation process for specified or all files"""
+    def process_validation(self, target_files: Optional[List[str]] = None, max_jobs: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Runs validation process for specified or all files
+        
+        Args:
+            target_files: Optional list of file names (without .json extension)
+            max_jobs: Number of harness workers evaluating instances in parallel
+            
+        Returns:
+            Dictionary with processing summary
+        """
+        if max_jobs is not None and max_jobs < 1:
+            return {"error": f"max_jobs must be at least 1, got {max_jobs}"}
+        
         try:
             if target_files is None:
                 # Process all JSON files
-                json_files_found = list(self.source_directory.glob("*.json"))
-                target_files = [f.stem for f in json_files_found]
-                log_instance.info(f"Processing {len(target_files)} files")
+                json_files_found = list_json_files(self.source_directory)
+                target_files = sorted(f.stem for f in json_files_found)
+                log_instance.info("Processing %d files", len(target_files))
             else:
-                log_instance.info(f"Processing {len(target_files)} specified files")
+                # Results are keyed by file stem, so accept names given with the extension
+                target_files = [
+                    filename[:-len('.json')] if filename.endswith('.json') else filename
+                    for filename in target_files
+                ]
+                log_instance.info("Processing %d specified files", len(target_files))
             
             if not target_files:
                 return {"error": "No files found for processing"}
@@ -238,9 +409,12 @@ class DataPointProcessor:
                 "individual_results": {}
             }
             
+            # Load all files at once and evaluate them in a single harness run
+            entries_by_filename = self.dataset_loader.load_datasets_by_file(self.source_directory, target_files)
+            file_results = self._run_batch_validation(target_files, entries_by_filename, max_jobs)
+            
             for filename in target_files:
-                log_instance.info(f"Processing: {filename}")
-                file_validation_result = self._process_single_file(filename)
+                file_validation_result = file_results[filename]
                 processing_summary["individual_results"][filename] = file_validation_result
                 
                 # Считаем успешными только файлы со статусом "success"
@@ -252,10 +426,10 @@ class DataPointProcessor:
                     if file_validation_result.get("success", False):
                         # Файл обработался, но валидация не прошла
                         validation_status = file_validation_result.get("validation_analysis", {}).get("validation_status", "unknown")
-                        log_instance.error(f"File validation failed: {filename} - status: {validation_status}")
+                        log_instance.error("File validation failed: %s - status: %s", filename, validation_status)
                     else:
                         # Общая ошибка обработки
-                        log_instance.error(f"File error: {filename} - {file_validation_result.get('error', 'unknown error')}")
+                        log_instance.error("File error: %s - %s", filename, file_validation_result.get("error", "unknown error"))
             
             success_percentage = (processing_summary["success_count"] / processing_summary["total_processed"]) * 100 if processing_summary["total_processed"] > 0 else 0
             processing_summary["success_percentage"] = success_percentage
@@ -263,109 +437,206 @@ class DataPointProcessor:
             return processing_summary
             
         except Exception as processing_error:
-            log_instance.error(f"Validation error: {processing_error}")
+            log_instance.error("Validation error: %s", processing_error)
             return {"error": str(processing_error)}
     
-    def _process_single_file(self, filename: str) -> Dict[str, Any]:
-        """Processes a single file"""
-        execution_id = filename
-        predictions_output_file = f"predictions_{filename}.jsonl"
-        logs_directory = Path("logs/run_evaluation") / execution_id / "gpt-4"
+    def _run_batch_validation(self, target_files: List[str], entries_by_filename: Dict[str, Dict[str, Any]],
+                              max_jobs: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluates all loaded files with a single Docker harness run
         
-        try:
-            # Load data
-            loaded_datasets = self.dataset_loader.load_datasets(self.source_directory, [filename])
-            
-            if not loaded_datasets:
-                return {"success": False, "error": f"Failed to load {filename}.json"}
-            
-            dataset_entry = loaded_datasets[0]
-            entry_instance_id = dataset_entry.get("instance_id", "unknown")
-            
-            # Convert to prediction format
-            formatted_predictions = self.prediction_formatter.transform_to_predictions([dataset_entry])
-            
-            if not formatted_predictions:
-                return {"success": False, "error": "Failed to convert to prediction format"}
-            
-            # Save predictions file
-            if not self.prediction_formatter.write_predictions_file(formatted_predictions, predictions_output_file):
-                return {"success": False, "error": "Failed to save predictions file"}
-            
-            # Run Docker evaluation
-            docker_execution_result = self._run_docker_evaluation(predictions_output_file, execution_id)
+        Args:
+            target_files: File names (without .json extension) to validate
+            entries_by_filename: Loaded data keyed by file name
+            max_jobs: Number of harness workers, defaults to CPU count
             
+        Returns:
+            Dictionary mapping file name to its processing result
+        """
+        # The suffix keeps run ids unique across runs started within the same second,
+        # otherwise the harness would reuse reports already written under that id
+        execution_id = f"{datetime.now():batch_%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+        predictions_output_file = f"predictions_{execution_id}.jsonl"
+        
+        file_results = {
+            filename: {"success": False, "error": f"Failed to load {filename}.json"}
+            for filename in target_files if filename not in entries_by_filename
+        }
+        
+        # The harness keys predictions and reports by instance_id, so only the
+        # first file providing an instance_id can be evaluated in the batch
+        unique_entries = {}
+        filename_by_instance_id = {}
+        for filename, dataset_entry in entries_by_filename.items():
+            entry_instance_id = dataset_entry["instance_id"]
+            if entry_instance_id in filename_by_instance_id:
+                file_results[filename] = {
+                    "success": False,
+                    "error": f"Duplicate instance_id {entry_instance_id}, already provided by "
+                             f"{filename_by_instance_id[entry_instance_id]}.json"
+                }
+            else:
+                filename_by_instance_id[entry_instance_id] = filename
+                unique_entries[filename] = dataset_entry
+        entries_by_filename = unique_entries
+        
+        if not entries_by_filename:
+            return file_results
+        
+        # Convert to prediction format
+        formatted_predictions = self.prediction_formatter.transform_to_predictions(list(entries_by_filename.values()))
+        converted_ids = {prediction["instance_id"] for prediction in formatted_predictions}
+        
+        batch_error = None
+        docker_error = None
+        if not formatted_predictions:
+            batch_error = "Failed to convert to prediction format"
+        elif not self.prediction_formatter.write_predictions_file(formatted_predictions, predictions_output_file):
+            batch_error = "Failed to save predictions file"
+        else:
+            if max_jobs is None:
+                max_jobs = os.cpu_count() or 1
+            worker_count = min(len(formatted_predictions), max_jobs)
+            # Keep the 30 minute budget per instance for each round of workers
+            batch_timeout = 1800 * -(-len(formatted_predictions) // worker_count)
+            docker_execution_result = self._run_docker_evaluation_batch(
+                predictions_output_file, execution_id, worker_count, batch_timeout
+            )
             if not docker_execution_result["success"]:
-                return {"success": False, "error": f"Docker evaluation failed: {docker_execution_result['error']}"}
-            
-            # Check results
-            result_analysis = self._analyze_test_results(dataset_entry, logs_directory)
+                # Reports written before the failure are still used, only
+                # instances without a report are attributed to the failed run
+                docker_error = f"Docker evaluation failed: {docker_execution_result['error']}"
+                log_instance.error(docker_error)
+        
+        evaluated_entries = {}
+        for filename, dataset_entry in entries_by_filename.items():
+            if batch_error is not None:
+                file_results[filename] = {"success": False, "error": batch_error}
+            elif dataset_entry.get("instance_id") not in converted_ids:
+                file_results[filename] = {"success": False, "error": "Failed to convert to prediction format"}
+            else:
+                evaluated_entries[filename] = dataset_entry
+        
+        if not evaluated_entries:
+            return file_results
+        
+        logs_directory = Path("logs/run_evaluation") / execution_id / "gpt-4"
+        test_reports, report_errors = self._load_reports({
+            filename: logs_directory / dataset_entry["instance_id"] / "report.json"
+            for filename, dataset_entry in evaluated_entries.items()
+        })
+        
+        if docker_error is not None:
+            for report_error in report_errors.values():
+                if report_error["validation_status"] == "report_not_found":
+                    report_error["error"] = f"{report_error['error']}; {docker_error}"
+        
+        for filename, dataset_entry in evaluated_entries.items():
+            if filename in report_errors:
+                result_analysis = report_errors[filename]
+            else:
+                result_analysis = self._analyze_test_results(dataset_entry, test_reports[filename])
             
-            return {
+            file_results[filename] = {
                 "success": True,
-                "instance_id": entry_instance_id,
+                "instance_id": dataset_entry["instance_id"],
                 "run_id": execution_id,
                 "validation_analysis": result_analysis
             }
+        
+        return file_results
+    
+    def _load_reports(self, report_paths: Dict[str, Path]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Reads harness reports concurrently to overlap disk waits
+        
+        Args:
+            report_paths: Report file path keyed by file name
             
-        except Exception as file_error:
-            log_instance.error(f"Error processing {filename}: {file_error}")
-            return {"success": False, "error": str(file_error)}
+        Returns:
+            Parsed reports and validation errors for unreadable reports, both keyed by file name
+        """
+        test_reports = {}
+        report_errors = {}
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(report_paths))) as executor:
+            report_futures = {
+                filename: executor.submit(self._read_report, report_file_path)
+                for filename, report_file_path in report_paths.items()
+            }
+        
+        for filename, report_future in report_futures.items():
+            try:
+                test_reports[filename] = report_future.result()
+            except FileNotFoundError:
+                report_errors[filename] = {
+                    "validation_status": "report_not_found",
+                    "error": f"File {report_paths[filename]} does not exist"
+                }
+            except Exception as read_error:
+                report_errors[filename] = {
+                    "validation_status": "read_error",
+                    "error": str(read_error)
+                }
+        
+        return test_reports, report_errors
+    
+    @staticmethod
+    def _read_report(report_file_path: Path) -> Dict[str, Any]:
+        """Reads and decodes a single harness report"""
+        return json_loads(report_file_path.read_bytes())
     
-    def _run_docker_evaluation(self, predictions_file: str, execution_id: str) -> Dict[str, Any]:
-        """Runs Docker container for evaluation"""
+    def _run_docker_evaluation_batch(self, predictions_path: str, run_id: str, max_workers: int = 1,
+                                     timeout: int = 1800) -> Dict[str, Any]:
+        """Runs a single Docker container evaluating every prediction in the file"""
         docker_command = [
             "docker", "compose", "run", "--rm", "data-quality-checker",
             "python", "-m", "swebench.harness.run_evaluation",
-            "--predictions_path", predictions_file,
-            "--run_id", execution_id,
+            "--predictions_path", predictions_path,
+            "--run_id", run_id,
             "--dataset_name", "SWE-bench/SWE-bench",
+            "--max_workers", str(max_workers),
             "--clean", "True"
         ]
         
+        # Harness output can be very large, stream it to a file instead of memory
+        docker_log_path = Path("logs") / f"docker_{run_id}.log"
+        
         try:
-            execution_result = subprocess.run(
-                docker_command,
-                capture_output=True,
-                text=True,
-                timeout=1800  # 30 minutes timeout
-            )
+            docker_log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(docker_log_path, 'wb') as docker_log_file:
+                execution_result = subprocess.run(
+                    docker_command,
+                    stdout=docker_log_file,
+                    stderr=subprocess.STDOUT,
+                    timeout=timeout
+                )
             
             if execution_result.returncode == 0:
                 return {"success": True}
             else:
-                return {"success": False, "error": f"Exit code: {execution_result.returncode}"}
+                return {"success": False, "error": f"Exit code: {execution_result.returncode} (see {docker_log_path})"}
                 
         except subprocess.TimeoutExpired:
-            return {"success": False, "error": "Execution timeout exceeded"}
+            return {"success": False, "error": f"Execution timeout exceeded (see {docker_log_path})"}
         except Exception as docker_error:
             return {"success": False, "error": str(docker_error)}
     
-    def _analyze_test_results(self, dataset_entry: Dict[str, Any], logs_directory: Path) -> Dict[str, Any]:
-        """Analyzes test results"""
+    def _analyze_test_results(self, dataset_entry: Dict[str, Any], test_report: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyzes test results of an already loaded harness report"""
         entry_instance_id = dataset_entry["instance_id"]
-        expected_failing_tests = json.loads(dataset_entry["FAIL_TO_PASS"])
-        expected_passing_tests = json.loads(dataset_entry["PASS_TO_PASS"])
-        report_file_path = logs_directory / entry_instance_id / "report.json"
-        
-        if not report_file_path.exists():
-            return {
-                "validation_status": "report_not_found",
-                "error": f"File {report_file_path} does not exist"
-            }
+        expected_failing_tests = dataset_entry["FAIL_TO_PASS"]
+        expected_passing_tests = dataset_entry["PASS_TO_PASS"]
         
         try:
-            with open(report_file_path, 'r', encoding='utf-8') as report_file:
-                test_report = json.load(report_file)
-            
             instance_report_data = test_report.get(entry_instance_id, {})
             test_statuses = instance_report_data.get("tests_status", {})
             
             actual_failing_tests = test_statuses.get("FAIL_TO_PASS", {}).get("success", [])
             actual_passing_tests = test_statuses.get("PASS_TO_PASS", {}).get("success", [])
             
-            failing_tests_match = set(expected_failing_tests) == set(actual_failing_tests)
-            passing_tests_match = set(expected_passing_tests) == set(actual_passing_tests)
+            failing_tests_match = dataset_entry["_fail_to_pass_set"] == set(actual_failing_tests)
+            passing_tests_match = dataset_entry["_pass_to_pass_set"] == set(actual_passing_tests)
             
             problem_resolved = instance_report_data.get("resolved", False)
             
@@ -448,6 +719,20 @@ class DataPointProcessor:
             print(f"\n😞 Most files failed validation")
 
 
+def positive_int(raw_value: str) -> int:
+    """Parses a command line value that must be an integer of at least 1"""
+    import argparse
+    
+    try:
+        parsed_value = int(raw_value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{raw_value}'")
+    
+    if parsed_value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {parsed_value}")
+    return parsed_value
+
+
 def main():
     """Main program function"""
     import argparse
@@ -459,14 +744,18 @@ def main():
                            help="Specific file names for validation (without .json extension)")
     arg_parser.add_argument("--verbose", action="store_true", 
                            help="Verbose logging")
+    arg_parser.add_argument("--jobs", type=positive_int, default=None,
+                           help="Number of instances evaluated in parallel by the harness (default: CPU count)")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                           help="Re-check every file instead of skipping unchanged rejected ones")
     
     parsed_args = arg_parser.parse_args()
     
     if parsed_args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    data_processor = DataPointProcessor(data_folder=parsed_args.data_dir)
-    validation_results = data_processor.process_validation(parsed_args.files)
+    data_processor = DataPointProcessor(data_folder=parsed_args.data_dir, use_cache=not parsed_args.no_cache)
+    validation_results = data_processor.process_validation(parsed_args.files, max_jobs=parsed_args.jobs)
     data_processor.print_summary_report(validation_results)
     
     if "error" in validation_results: